@@ -1663,7 +1663,8 @@ class Container:  # pylint: disable=too-many-public-methods
         if vacuum:
             self._vacuum()
 
-        all_duplicates = os.listdir(self._get_duplicates_folder())
+        duplicates_folder = self._get_duplicates_folder()
+        all_duplicates = os.listdir(duplicates_folder)
         duplicates_mapping = defaultdict(list)
 
         for duplicate in all_duplicates:
@@ -1694,11 +1695,11 @@ class Container:  # pylint: disable=too-many-public-methods
             if computed_hash == reference_obj_hashkey:
                 # The object is in the repo and has the correct hashkey: we just remove all duplicates
                 for duplicate in duplicates_mapping[reference_obj_hashkey]:
-                    os.remove(os.path.join(self._get_duplicates_folder(), duplicate))
+                    os.remove(os.path.join(duplicates_folder, duplicate))
             else:
                 good_duplicate = None
                 for duplicate in duplicates_mapping[reference_obj_hashkey]:
-                    with open(os.path.join(self._get_duplicates_folder(), duplicate), 'rb') as fhandle:
+                    with open(os.path.join(duplicates_folder, duplicate), 'rb') as fhandle:
                         computed_hash, _ = compute_hash_and_size(fhandle, self.hash_type)
                     if computed_hash == reference_obj_hashkey:
                         # We found a duplicate that has the correct hash key: let's put it in place
@@ -1713,7 +1714,7 @@ class Container:  # pylint: disable=too-many-public-methods
                 # It should not be None, I should have raised!
                 assert good_duplicate is not None
                 os.replace(
-                    os.path.join(self._get_duplicates_folder(), good_duplicate),
+                    os.path.join(duplicates_folder, good_duplicate),
                     self._get_loose_path_from_hashkey(reference_obj_hashkey)
                 )
                 # Let's remove all other duplicates
@@ -1721,7 +1722,7 @@ class Container:  # pylint: disable=too-many-public-methods
                     if duplicate == good_duplicate:
                         # Let's skip the one I already moved
                         continue
-                    os.remove(os.path.join(self._get_duplicates_folder(), duplicate))
+                    os.remove(os.path.join(duplicates_folder, duplicate))
 
         loose_objects = set(self._list_loose())
         # Force reload of the session to get the most up-to-date packed objects
@@ -2181,7 +2182,8 @@ class Container:  # pylint: disable=too-many-public-methods
         deleted_loose = set()
         deleted_packed = set()
 
-        all_duplicates = os.listdir(self._get_duplicates_folder())
+        duplicates_folder = self._get_duplicates_folder()
+        all_duplicates = os.listdir(duplicates_folder)
 
         for hashkey in hashkeys:
             # Filter only duplicates of this object and delete them
@@ -2192,7 +2194,7 @@ class Container:  # pylint: disable=too-many-public-methods
             for duplicate_fname in duplicates_this_object:
                 # For now I don't put checks - I should be the only one accessing the container, so I should not
                 # get PermissionError or similar exceptionss
-                os.remove(os.path.join(self._get_duplicates_folder(), duplicate_fname))
+                os.remove(os.path.join(duplicates_folder, duplicate_fname))
             try:
                 os.remove(self._get_loose_path_from_hashkey(hashkey))
                 deleted_loose.add(hashkey)